@@ -2,14 +2,21 @@
 Dataset
 Functions that were used during setup and are not necessary for casual usage.
 """
+import csv
+import functools
+import hashlib
+import html
 import json
 import re
 from importlib.resources import files
 from pathlib import Path
 
+import lxml.html
 import pandas as pd
 import pooch
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .fetchers import _session, _session_downloader
 
 
 __all__ = [
@@ -17,6 +24,7 @@ __all__ = [
     "get_all_dataset_ids",
     "fetch_grid_file",
     "fetch_source_file",
+    "iter_source_dreams",
     "read_source_dreams_as_df",
     "read_source_info_as_dict",
     "write_source_registry",
@@ -33,6 +41,20 @@ __all__ = [
 # All pooch downloads go here.
 _cache_dir = pooch.os_cache("dreambank")
 
+# Streamed sha256 digests recorded by `_hashing_downloader`, keyed by URL.
+_stream_hashes = {}
+
+
+def _hashing_downloader(url, output_file, pup):
+    """Download through the shared session while hashing the stream inline.
+
+    Records the sha256 digest in `_stream_hashes` so `write_source_registry`
+    does not need to re-read each freshly written file from disk.
+    """
+    hasher = hashlib.sha256()
+    _session_downloader(url, output_file, pup, hasher=hasher)
+    _stream_hashes[url] = hasher.hexdigest()
+
 # Identify the more permanent GitHub data directory that will be used to store
 # permanent files like the tabular data files and registry.
 # Write all tabular/tsv files within the local repository folder.
@@ -41,6 +63,57 @@ _data_dir = _repo_dir.joinpath("datasets")  # for curated TSV/JSON files
 _source_registry_filepath = _repo_dir.joinpath("registry-source.txt")
 _curated_registry_filepath = _repo_dir.joinpath("registry.txt")
 
+# One combined pattern per dream span (number, optional date, text, word
+# count), compiled once to keep the inner loop tight.
+_RE_DREAM = re.compile(
+    r"^#(?P<n>\S+) (?:(?P<date>\(\S*\)) )?(?P<body>.*?)(?P<wcsuf>[ \n]?\([0-9]+ words\))$",
+    flags=re.DOTALL,
+)
+
+# Labelled metadata fields on the info page, matched in one sweep over the raw
+# HTML bytes (each value is the text following the next tag boundary).
+_RE_INFO = re.compile(
+    rb"Dream series:.*?>\s*([^<]+)"
+    rb".*?Number of dreams:.*?>\s*([^<]+)"
+    rb".*?Year:.*?>\s*([^<]+)"
+    rb".*?Sex of the dreamer\(s\):.*?>\s*([^<]+)",
+    flags=re.DOTALL,
+)
+
+# HTML tags, stripped from the raw description slice of the info page.
+_RE_TAG = re.compile(r"<[^>]+>")
+
+
+def _parse_registry(fp):
+    """Parse a registry txt file into a dict mapping fname to its other fields.
+
+    Returns an empty dict if the registry file does not exist.
+    """
+    rows = {}
+    if fp.exists():
+        with open(fp, "rt", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if not fields:
+                    continue  # tolerate blank lines, as pooch's load_registry does
+                rows[fields[0]] = fields[1:]
+    return rows
+
+
+def _read_mtime_sidecar(fp):
+    """Read a sidecar json of fname -> st_mtime_ns used for incremental rebuilds."""
+    if fp.exists():
+        with open(fp, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def _write_mtime_sidecar(fp, mtimes):
+    """Write the fname -> st_mtime_ns sidecar next to the cached files."""
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    with open(fp, "wt", encoding="utf-8", newline="\n") as f:
+        json.dump(mtimes, f, indent=4, sort_keys=True)
+
 
 def load_source_repository():
     """Load a Pooch repository for the HTML files.
@@ -62,16 +135,30 @@ def load_source_repository():
     return pup
 
 
-def fetch_grid_file():
+@functools.lru_cache(maxsize=2)
+def fetch_grid_file(strict_hash=True):
     """
     Download the DreamBank grid file (if not already downloaded)
     and return the filepath.
 
+    The filepath is cached, so repeated calls within a process skip
+    Pooch's hash check of the local file.
+
     The grid file is a DreamBank page that includes a table of all the
     datasets available in DreamBank. This file is used to create a registry,
     ensuring that all available datasets are included. It also provides easy
     access to all the dataset IDs, which are used for subsequent web scraping.
 
+    Parameters
+    ----------
+    strict_hash : bool
+        If ``True`` (default), require the downloaded file to match the
+        pinned sha256 hash. If ``False``, accept whatever the server
+        currently serves, re-downloading only when the server's
+        ETag/Last-Modified headers differ from the cached copy. Useful when
+        DreamBank updates the grid page upstream and the pinned hash has not
+        been refreshed yet.
+
     Returns
     -------
     fp : str
@@ -79,27 +166,52 @@ def fetch_grid_file():
     """
     grid_url = "https://dreambank.net/grid.cgi"
     grid_hash = "sha256:f31487774cce789fe9bcbe3c7c680be52fbdd8380afb391aee5fa1fe11e68660"
-    fp = pooch.retrieve(grid_url, path=_cache_dir, known_hash=grid_hash)
+    if strict_hash:
+        fp = pooch.retrieve(grid_url, path=_cache_dir, known_hash=grid_hash, downloader=_session_downloader)
+        return fp
+    # Relaxed mode: validate the cached copy against the server's
+    # ETag/Last-Modified headers instead of a pinned hash.
+    cached_fp = Path(_cache_dir).joinpath("grid.html")
+    headers_fp = Path(_cache_dir).joinpath("grid-headers.json")
+    response = _session.head(grid_url, timeout=30)
+    validators = {
+        k: response.headers[k] for k in ("ETag", "Last-Modified") if k in response.headers
+    }
+    if cached_fp.exists() and headers_fp.exists() and validators:
+        with open(headers_fp, "rt", encoding="utf-8") as f:
+            if json.load(f) == validators:
+                return str(cached_fp)
+    # Stale or never cached; force a fresh download and record the validators.
+    cached_fp.unlink(missing_ok=True)
+    fp = pooch.retrieve(
+        grid_url, path=_cache_dir, fname=cached_fp.name, known_hash=None, downloader=_session_downloader
+    )
+    with open(headers_fp, "wt", encoding="utf-8", newline="\n") as f:
+        json.dump(validators, f, indent=4)
     return fp
 
 
+@functools.lru_cache(maxsize=1)
 def get_all_dataset_ids():
-    """Return a list of all available datasets.
+    """Return a tuple of all available datasets.
 
-    Parses the HTML grid file to return a list of all available DreamBank
-    datasets.
+    Parses the HTML grid file to return a tuple of all available DreamBank
+    datasets. The result is cached, so the HTML is only parsed once per
+    process no matter how many callers ask for the IDs.
 
     .. seealso:: :func:`~dreambank.curation.fetch_grid_file`
 
     Returns
     -------
-    datasets : list of str
-        List of all available datasets in DreamBank.
+    datasets : tuple of str
+        All available datasets in DreamBank.
     """
     fp = fetch_grid_file()
+    # Only the checkbox inputs are of interest, so skip building the rest of the tree.
+    strainer = SoupStrainer("input", attrs={"type": "checkbox"})
     with open(fp, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
-    datasets = sorted(x.get("value") for x in soup.find_all("input", type="checkbox"))
+        soup = BeautifulSoup(f, "lxml", parse_only=strainer)
+    datasets = tuple(sorted(x.get("value") for x in soup.find_all("input", type="checkbox")))
     assert len(datasets) == len(set(datasets)), "Unexpected duplicate values found in `datasets`"
     return datasets
 
@@ -130,21 +242,69 @@ def write_source_registry(overwrite=False):
     ------
     `OSError` if registry file already exists and `overwrite` is ``False``.
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     from tqdm import tqdm
     if _source_registry_filepath.exists() and not overwrite:
         raise OSError("Registry file already exists.")
+    # Build the full list of files to retrieve up front, then download them
+    # concurrently. Each retrieval is an independent GET, so wall time is
+    # dominated by sequential HTTPS round-trips when done serially.
+    fnames_and_urls = {}
+    for d in get_all_dataset_ids():
+        fnames_and_urls[f"{d}/dreams.html"] = f"https://dreambank.net/random_sample.cgi?series={d}"
+        fnames_and_urls[f"{d}/info.html"] = f"https://dreambank.net/more_info.cgi?series={d}"
+        fnames_and_urls[f"{d}/moreinfo.html"] = f"https://dreambank.net/more_info.cgi?series={d}&further=1"
+    # Incremental rebuild: rows from a previous registry are reused (no
+    # re-download, no re-hash) when the cached file still exists and its mtime
+    # matches the sidecar recorded at the time it was last hashed.
+    old_rows = _parse_registry(_source_registry_filepath)
+    sidecar_fp = Path(_cache_dir).joinpath("registry-source-mtimes.json")
+    mtimes = _read_mtime_sidecar(sidecar_fp)
+    hashes = {}
+    stale = {}
+    for fn, url in fnames_and_urls.items():
+        cached_fp = Path(_cache_dir).joinpath(fn)
+        old = old_rows.get(fn)
+        if (
+            old is not None
+            and old[1] == url
+            and cached_fp.exists()
+            and mtimes.get(fn) == cached_fp.stat().st_mtime_ns
+        ):
+            hashes[fn] = old[0].partition(":")[2]
+        else:
+            stale[fn] = url
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {
+            executor.submit(
+                pooch.retrieve,
+                url=url,
+                fname=fn,
+                path=_cache_dir,
+                known_hash=None,
+                downloader=_hashing_downloader,
+            ): fn
+            for fn, url in stale.items()
+        }
+        pbar = tqdm(as_completed(futures), total=len(futures), desc="Creating source repository")
+        for future in pbar:
+            fn = futures[future]
+            fp = future.result()
+            # The downloader hashed the stream as it was written; fall back to
+            # hashing the file only if Pooch served it from cache (no download).
+            file_hash = _stream_hashes.pop(fnames_and_urls[fn], None)
+            hashes[fn] = file_hash if file_hash is not None else pooch.file_hash(fp)
+            mtimes[fn] = Path(fp).stat().st_mtime_ns
+    _write_mtime_sidecar(sidecar_fp, mtimes)
+    # Write rows in dataset-major order (sorted IDs x dreams/info/moreinfo) so
+    # the registry file matches the committed layout regardless of the order
+    # in which downloads completed.
     with open(_source_registry_filepath, "wt", encoding="utf-8", newline="\n") as f:
-        for d in (pbar := tqdm(get_all_dataset_ids())):
-            pbar.set_description(f"Creating source repository for {d}")
-            fnames_and_urls = {
-                f"{d}/dreams.html": f"https://dreambank.net/random_sample.cgi?series={d}",
-                f"{d}/info.html": f"https://dreambank.net/more_info.cgi?series={d}",
-                f"{d}/moreinfo.html": f"https://dreambank.net/more_info.cgi?series={d}&further=1",
-            }
-            for fn, url in fnames_and_urls.items():
-                fp = pooch.retrieve(url=url, fname=fn, path=_cache_dir, known_hash=None)
-                file_hash = pooch.file_hash(fp)
-                f.write(f"{fn} sha256:{file_hash} {url}\n")
+        for d in get_all_dataset_ids():
+            for component in ("dreams", "info", "moreinfo"):
+                fn = f"{d}/{component}.html"
+                f.write(f"{fn} sha256:{hashes[fn]} {fnames_and_urls[fn]}\n")
 
 
 def write_curated_registry(overwrite=False):
@@ -165,15 +325,27 @@ def write_curated_registry(overwrite=False):
     """
     if _curated_registry_filepath.exists() and not overwrite:
         raise OSError("Curated registry file already exists.")
+    # Incremental rebuild: reuse the previous hash for any data file whose
+    # mtime has not changed since it was last hashed (tracked in a sidecar).
+    old_rows = _parse_registry(_curated_registry_filepath)
+    sidecar_fp = Path(_cache_dir).joinpath("registry-curated-mtimes.json")
+    mtimes = _read_mtime_sidecar(sidecar_fp)
     with open(_curated_registry_filepath, "wt", encoding="utf-8", newline="\n") as f:
         for d in get_all_dataset_ids():
             for suffix in [".tsv", ".json"]:
                 fp = _data_dir.joinpath(d).with_suffix(suffix)
                 fname = fp.name
                 hash_alg = "sha256"
-                known_hash = pooch.file_hash(fp, alg=hash_alg)
-                row_string = f"{fname} {hash_alg}:{known_hash}\n"
+                mtime = fp.stat().st_mtime_ns
+                old = old_rows.get(fname)
+                if old is not None and mtimes.get(fname) == mtime:
+                    row_hash = old[0]
+                else:
+                    row_hash = f"{hash_alg}:{pooch.file_hash(fp, alg=hash_alg)}"
+                mtimes[fname] = mtime
+                row_string = f"{fname} {row_hash}\n"
                 f.write(row_string)
+    _write_mtime_sidecar(sidecar_fp, mtimes)
 
 
 def fetch_source_file(dataset, component, **kwargs):
@@ -197,59 +369,116 @@ def fetch_source_file(dataset, component, **kwargs):
     available_components = {"dreams", "info", "moreinfo"}
     assert component in available_components, f"`component` must be one of {available_components}"
     pup = load_source_repository()
+    kwargs.setdefault("downloader", _session_downloader)
     fp = pup.fetch(f"{dataset}/{component}.html", **kwargs)
     return fp
 
 
-def read_source_dreams_as_df(dataset_id):
+def iter_source_dreams(dataset_id):
     """
-    Parse DreamBank HTML dreams page for a given dataset into a :class:`~pandas.DataFrame`.
+    Parse DreamBank HTML dreams page for a given dataset, yielding one dream at a time.
 
     Parameters
     ----------
     dataset_id : str
         DreamBank dataset to load. Must be one of the available DreamBank datasets.
 
-    Returns
-    -------
-    dreams : :class:`pandas.DataFrame`
-        A :class:`~pandas.DataFrame` with 3 columns.
+    Yields
+    ------
+    dream : tuple of str
+        A ``(n, date, dream)`` tuple per dream.
 
         * ``n`` - The dream number in the sequence, of type ``str``.
             String because sometimes there is 111a (e.g., Alta)
+        * ``date`` - The provided date of the dream (``None`` if not present).
         * ``dream`` - The dream text, of type ``str``.
-        * ``date`` - If present, the provided date of the dream, of type ``str``.
     """
     fp = fetch_source_file(dataset_id, "dreams")
-    with open(fp, "rb") as f:
-        soup = BeautifulSoup(f, "html.parser", from_encoding="ISO-8859-1")
+    # Parse with lxml directly: iterating elements and pulling their text
+    # stays at the C level, avoiding a bs4 Tag wrapper per span.
+    parser = lxml.html.HTMLParser(encoding="ISO-8859-1")
+    tree = lxml.html.parse(fp, parser=parser).getroot()
     # Find all spans that do not have "comment" class labels.
     # Comments will already be present in the regular spans/dreams as bracketed content.
-    data = []
-    for span in soup.find_all("span", style=False, class_=lambda x: x != "comment"):
-        span_text = span.get_text(separator=" ", strip=True)
-        # Extract the dream number (and potentially date) from beginning of string
-        match_ = re.match(r"^#(\S+) ((\(\S*\)) )?", span_text)
-        assert match_ is not None, f"Did not find dream number match for dataset {dataset_id}, dream {dream_n}."
-        dream_n = match_.group(1)  # The number of dream in the whole sequence
-        dream_date = match_.group(3)  # will be None if not found
-        # Remove the dream number (and potentially date) from the beginning of string
-        dream_and_wc_text = re.sub(r"^#([0-9]+) ((\(\S*\)) )?", "", span_text)
-        # Remove the word count from end of string
-        n_wc_matches = len(re.findall(r"[ \n]?\([0-9]+ words\)$", dream_and_wc_text))
-        assert n_wc_matches == 1, f"Found {n_wc_matches} WC match for dataset {dataset_id}, dream {dream_n} (expected 1)."
-        dream_text = re.sub(r"[ \n]?\([0-9]+ words\)$", "", dream_and_wc_text)
-        assert dream_n not in data, "Unexpected duplicate dream number"
-        data.append(dict(n=dream_n, date=dream_date, dream=dream_text))
+    seen_ns = set()
+    for span in tree.iter("span"):
+        if "style" in span.attrib or span.get("class") == "comment":
+            continue
+        # Equivalent of bs4's get_text(separator=" ", strip=True).
+        span_text = " ".join(t for t in (s.strip() for s in span.itertext()) if t)
+        # Extract the dream number, optional date, text, and word count in one
+        # regex sweep instead of separate match/sub/search/sub passes.
+        match_ = _RE_DREAM.match(span_text)
+        assert match_ is not None, f"Did not find dream match for dataset {dataset_id}."
+        dream_n = match_["n"]  # The number of dream in the whole sequence
+        dream_date = match_["date"]  # will be None if not found
+        if dream_n.isdigit():
+            dream_text = match_["body"]
+        else:
+            # The number/date head has only ever been stripped for purely
+            # numeric dream numbers (e.g. Alta's 111a keeps its head);
+            # preserve that so the curated output stays stable.
+            dream_text = span_text[: match_.start("wcsuf")]
+        assert dream_n not in seen_ns, "Unexpected duplicate dream number"
+        seen_ns.add(dream_n)
+        yield dream_n, dream_date, dream_text
     # Make sure the correct number of dreams were extracted.
     # At the top of each page, DreamBank will say how many dreams are present in the
     # total dataset, as well as how many are displayed on the page. These, and the total
     # amount of dreams extracted, should all be the same.
-    n_dreams_statement = soup.find("h4").find_next().get_text()
+    # The dream-count statement sits in the element just after the <h4>
+    # heading in document order (same walk as bs4's find_next).
+    elements = tree.iter()
+    for elem in elements:
+        if elem.tag == "h4":
+            n_dreams_statement = next(elements).text_content()
+            break
+    else:
+        raise AssertionError(f"Did not find dream-count heading for dataset {dataset_id}.")
     n_dreams_total, n_dreams_displayed = re.findall(r"[0-9]+", n_dreams_statement)
-    n_dreams_extracted = len(data)
+    n_dreams_extracted = len(seen_ns)
     assert int(n_dreams_total) == int(n_dreams_displayed) == n_dreams_extracted
-    dreams = pd.DataFrame(data).replace(dict(date={None: pd.NA})).astype(dict(n="string", date="string", dream="string")).dropna(how="all", axis=1).sort_index(axis=0)
+
+
+def read_source_dreams_as_df(dataset_id):
+    """
+    Parse DreamBank HTML dreams page for a given dataset into a :class:`~pandas.DataFrame`.
+
+    .. seealso:: :func:`~dreambank.curation.iter_source_dreams`
+
+    Parameters
+    ----------
+    dataset_id : str
+        DreamBank dataset to load. Must be one of the available DreamBank datasets.
+
+    Returns
+    -------
+    dreams : :class:`pandas.DataFrame`
+        A :class:`~pandas.DataFrame` with 3 columns.
+
+        * ``n`` - The dream number in the sequence, of type ``str``.
+            String because sometimes there is 111a (e.g., Alta)
+        * ``dream`` - The dream text, of type ``str``.
+        * ``date`` - If present, the provided date of the dream, of type ``str``.
+    """
+    # Accumulate columns directly rather than a list of per-row dicts, so the
+    # DataFrame constructor skips row-wise dtype inference.
+    ns, dates, dream_texts = [], [], []
+    any_date = False
+    for dream_n, dream_date, dream_text in iter_source_dreams(dataset_id):
+        ns.append(dream_n)
+        dates.append(pd.NA if dream_date is None else dream_date)
+        dream_texts.append(dream_text)
+        any_date = any_date or dream_date is not None
+    # Dreams are yielded in page order onto a default RangeIndex, so no sort is
+    # needed, and the date column is only built when at least one dream has one.
+    # A single constructor call avoids the extra DataFrame allocations of the
+    # old replace/astype/dropna/sort_index chain.
+    columns = {"n": pd.array(ns, dtype="string")}
+    if any_date:
+        columns["date"] = pd.array(dates, dtype="string")
+    columns["dream"] = pd.array(dream_texts, dtype="string")
+    dreams = pd.DataFrame(columns)
     return dreams
 
 
@@ -276,16 +505,32 @@ def read_source_info_as_dict(dataset_id):
     """
     fp = fetch_source_file(dataset_id, "info")
     with open(fp, "rb") as f:
-        soup = BeautifulSoup(f, "html.parser", from_encoding="ISO-8859-1")
-    body = soup.find("body")
-    long_name = body.find(string="Dream series:").next.get_text(strip=True)
-    n_dreams = body.find(string="Number of dreams:").next.get_text(strip=True)
-    timeframe = body.find(string="Year:").next.get_text(strip=True)
-    sex = body.find(string="Sex of the dreamer(s):").next.get_text(strip=True)
+        html_bytes = f.read()
+    match_ = _RE_INFO.search(html_bytes)
+    if match_ is not None:
+        # Fast path: one regex sweep over the raw bytes instead of four
+        # full-tree string searches through the soup.
+        long_name, n_dreams, timeframe, sex = (
+            html.unescape(g.decode("ISO-8859-1").strip()) for g in match_.groups()
+        )
+    else:
+        soup = BeautifulSoup(html_bytes, "lxml", from_encoding="ISO-8859-1")
+        body = soup.find("body")
+        long_name = body.find(string="Dream series:").next.get_text(strip=True)
+        n_dreams = body.find(string="Number of dreams:").next.get_text(strip=True)
+        timeframe = body.find(string="Year:").next.get_text(strip=True)
+        sex = body.find(string="Sex of the dreamer(s):").next.get_text(strip=True)
+    # The description sits between the sex field and the back-link, so slice
+    # the raw bytes down to just that region instead of walking the whole
+    # document with get_text(), then strip tags/entities from the short slice.
+    _, sep, after_sex = html_bytes.partition(b"Sex of the dreamer(s):")
+    assert sep, f"Did not find description start marker for dataset {dataset_id}."
+    desc_slice = after_sex.split(b"[Back to search form]", 1)[0]
+    desc_text = html.unescape(_RE_TAG.sub("", desc_slice.decode("ISO-8859-1")))
     match_ = re.match(
-        rf".*Sex of the dreamer\(s\): {sex}\n\n\n?(.*?)\s+(For the further analyses, click here.\n)?\[Back to search form\]\s+$",
-        body.get_text(),
-        flags=re.DOTALL
+        rf"\s*{sex}\s+(.*?)\s*(For the further analyses, click here.\s*)?$",
+        desc_text,
+        flags=re.DOTALL,
     )
     assert match_ is not None, f"Error parsing info description for dataset {dataset_id}."
     description = match_.group(1)
@@ -322,20 +567,27 @@ def write_dreams_df_to_csv(dataset_id, overwrite=False):
     fp = _data_dir.joinpath(dataset_id).with_suffix(".tsv")
     if fp.exists() and not overwrite:
         raise OSError("File already exists. Set `overwrite` as True or delete local file.")
-    dreams = read_source_dreams_as_df(dataset_id)
-    # https://pandas.pydata.org/docs/user_guide/io.html#quoting-compression-and-file-format
-    dreams.to_csv(
-        path_or_buf=fp,
-        sep="\t",
-        na_rep="n/a",
-        index=False,
-        encoding="utf-8",
-        quoting=2,  # 2 = csv.QUOTE_NONNUMERIC
-        quotechar='"',
-        lineterminator="\n",
-        doublequote=True,
-        escapechar=None,
-    )
+    # Stream rows straight from the parser through csv.writer rather than
+    # materializing a DataFrame just to serialize it again. The dialect
+    # reproduces the previous pandas to_csv output (all fields quoted,
+    # doubled quotechars, "n/a" for missing dates, \n line endings).
+    rows = list(iter_source_dreams(dataset_id))
+    include_date = any(date is not None for _, date, _ in rows)
+    with open(fp, "wt", encoding="utf-8", newline="") as f:
+        writer = csv.writer(
+            f,
+            dialect="excel-tab",
+            quoting=csv.QUOTE_NONNUMERIC,
+            lineterminator="\n",
+        )
+        if include_date:
+            writer.writerow(["n", "date", "dream"])
+            writer.writerows(
+                (n, "n/a" if date is None else date, dream) for n, date, dream in rows
+            )
+        else:
+            writer.writerow(["n", "dream"])
+            writer.writerows((n, dream) for n, _, dream in rows)
 
 def write_info_dict_to_json(dataset_id, overwrite=False):
     """
@@ -360,12 +612,25 @@ def write_info_dict_to_json(dataset_id, overwrite=False):
     if fp.exists() and not overwrite:
         raise OSError("File already exists. Set `overwrite` as True or delete local file.")
     info = read_source_info_as_dict(dataset_id)
-    with open(fp, "wt", encoding="utf-8", newline="\n") as fp:
-        json.dump(info, fp, indent=4, sort_keys=False, ensure_ascii=False)
+    # Stdlib json with indent=4 is the canonical format of the committed
+    # corpus; rewriting it differently would invalidate every registry hash.
+    with open(fp, "wt", encoding="utf-8", newline="\n") as f:
+        json.dump(info, f, indent=4, sort_keys=False, ensure_ascii=False)
+
+
+def _curate_one_dataset(dataset_id, overwrite=False):
+    """Write the curated TSV and JSON files for a single dataset.
+
+    Kept at module level so it pickles for the process pool used by `curate`.
+    """
+    write_dreams_df_to_csv(dataset_id, overwrite=overwrite)
+    write_info_dict_to_json(dataset_id, overwrite=overwrite)
 
 
 def curate():
     import argparse
+    from concurrent.futures import ProcessPoolExecutor
+
     from tqdm import tqdm
     parser = argparse.ArgumentParser(
         prog="dreambank",
@@ -390,18 +655,23 @@ def curate():
     if "source" in args.steps:
         write_source_registry(overwrite=args.overwrite)
     if "tsv" in args.steps:
-        # Loop over all available datasets.
-        for d in (pbar := tqdm(get_all_dataset_ids())):
-            pbar.set_description(f"Creating tsv repository for {d}")
-            # For each available dataset, convert dreams (data) and info (metadata)
-            # from the source (html) to curated (tabular/tsv) format.
-            # dreams = read_source_dreams_as_df(d)
-            # info = read_source_info_as_dict(d)
-            # Write the new/curated format to the local GitHub repository.
-            write_dreams_df_to_csv(d, overwrite=args.overwrite)
-            write_info_dict_to_json(d, overwrite=args.overwrite)
+        # For each available dataset, convert dreams (data) and info (metadata)
+        # from the source (html) to curated (tabular/tsv) format and write them
+        # to the local GitHub repository. Datasets are independent and the work
+        # is CPU-bound on HTML parsing, so spread them across processes.
+        dataset_ids = get_all_dataset_ids()
+        worker = functools.partial(_curate_one_dataset, overwrite=args.overwrite)
+        with ProcessPoolExecutor() as executor:
+            list(
+                tqdm(
+                    executor.map(worker, dataset_ids),
+                    total=len(dataset_ids),
+                    desc="Creating tsv repository",
+                )
+            )
         # Write a new registry file for the curated/GitHub repository.
         # This is the one to be used from Python dreambank interface.
+        # This runs once, so it stays sequential.
         write_curated_registry(overwrite=args.overwrite)
     if "package_source_files" in args.steps:
         make_html_binaries()